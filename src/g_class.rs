@@ -4,15 +4,15 @@ pub struct NeuralNetwork {
     input_size: usize,
     hidden_size: usize,
     output_size: usize,
-    learning_rate: f64,
-    weights_input_hidden: Vec<Vec<f64>>,
-    weights_hidden_output: Vec<Vec<f64>>,
-    bias_hidden: Vec<f64>,
-    bias_output: Vec<f64>,
+    learning_rate: f32,
+    weights_input_hidden: Vec<Vec<f32>>,
+    weights_hidden_output: Vec<Vec<f32>>,
+    bias_hidden: Vec<f32>,
+    bias_output: Vec<f32>,
 }
 
 impl NeuralNetwork {
-    pub fn new(input_size: usize, hidden_size: usize, output_size: usize, learning_rate: f64) -> Self {
+    pub fn new(input_size: usize, hidden_size: usize, output_size: usize, learning_rate: f32) -> Self {
         let mut rng = rand::thread_rng();
         let weights_input_hidden = (0..hidden_size)
             .map(|_| (0..input_size).map(|_| rng.gen_range(-1.0..1.0)).collect())
@@ -34,31 +34,31 @@ impl NeuralNetwork {
         }
     }
 
-    fn sigmoid(x: f64) -> f64 {
+    fn sigmoid(x: f32) -> f32 {
         1.0 / (1.0 + (-x).exp())
     }
 
-    fn sigmoid_derivative(x: f64) -> f64 {
+    fn sigmoid_derivative(x: f32) -> f32 {
         x * (1.0 - x)
     }
 
-    pub fn forward(&self, input: &[f64]) -> (Vec<f64>, Vec<f64>) {
-        let hidden: Vec<f64> = self
+    pub fn forward(&self, input: &[f32]) -> (Vec<f32>, Vec<f32>) {
+        let hidden: Vec<f32> = self
             .weights_input_hidden
             .iter()
             .zip(self.bias_hidden.iter())
             .map(|(w, b)| {
-                let sum: f64 = w.iter().zip(input.iter()).map(|(wi, xi)| wi * xi).sum();
+                let sum: f32 = w.iter().zip(input.iter()).map(|(wi, xi)| wi * xi).sum();
                 Self::sigmoid(sum + b)
             })
             .collect();
 
-        let output: Vec<f64> = self
+        let output: Vec<f32> = self
             .weights_hidden_output
             .iter()
             .zip(self.bias_output.iter())
             .map(|(w, b)| {
-                let sum: f64 = w.iter().zip(hidden.iter()).map(|(wi, hi)| wi * hi).sum();
+                let sum: f32 = w.iter().zip(hidden.iter()).map(|(wi, hi)| wi * hi).sum();
                 Self::sigmoid(sum + b)
             })
             .collect();
@@ -66,25 +66,25 @@ impl NeuralNetwork {
         (hidden, output)
     }
 
-    pub fn train(&mut self, input: &[f64], target: &[f64]) {
+    pub fn train(&mut self, input: &[f32], target: &[f32]) {
         let (hidden, output) = self.forward(&input);
 
         // Calculate output errors
-        let output_errors: Vec<f64> = target
+        let output_errors: Vec<f32> = target
             .iter()
             .zip(output.iter())
             .map(|(t, o)| t - o)
             .collect();
 
         // Calculate output deltas
-        let output_deltas: Vec<f64> = output_errors
+        let output_deltas: Vec<f32> = output_errors
             .iter()
             .zip(output.iter())
             .map(|(e, o)| e * Self::sigmoid_derivative(*o))
             .collect();
 
         // Calculate hidden errors
-        let hidden_errors: Vec<f64> = self
+        let hidden_errors: Vec<f32> = self
             .weights_hidden_output
             .iter()
             .zip(output_deltas.iter())
@@ -92,7 +92,7 @@ impl NeuralNetwork {
             .collect();
 
         // Calculate hidden deltas
-        let hidden_deltas: Vec<f64> = hidden_errors
+        let hidden_deltas: Vec<f32> = hidden_errors
             .iter()
             .zip(hidden.iter())
             .map(|(e, h)| e * Self::sigmoid_derivative(*h))
@@ -123,7 +123,7 @@ impl NeuralNetwork {
         }
     }
 
-    pub fn predict(&self, input: &[f64]) -> Vec<f64> {
+    pub fn predict(&self, input: &[f32]) -> Vec<f32> {
         let (_, output) = self.forward(&input);
         output
     }
@@ -1,4 +1,5 @@
 use csv::ReaderBuilder;
+use std::io::Write;
 
 #[derive(Clone)]
 pub struct GameData {
@@ -25,17 +26,19 @@ impl GameData {
         self.state_of_cells_list[index]
     }
     pub fn print_game(&self) {
-        println!("Winner: {}", self.winner);
-        println!("Player 1: {}", self.player1);
-        println!("Player 2: {}", self.player2);
-        println!("---------------------------------");
+        // lock stdout once for the whole game instead of once per cell
+        let mut out = std::io::stdout().lock();
+        writeln!(out, "Winner: {}", self.winner).unwrap();
+        writeln!(out, "Player 1: {}", self.player1).unwrap();
+        writeln!(out, "Player 2: {}", self.player2).unwrap();
+        writeln!(out, "---------------------------------").unwrap();
         let mut row = 0;
         for state in self.state_of_cells_list.iter(){
-            print!("{} | => : ", row);
+            write!(out, "{} | => : ", row).unwrap();
             for cell in state.iter(){
-                print!("{} ", cell);
+                write!(out, "{} ", cell).unwrap();
             }
-            println!();
+            writeln!(out).unwrap();
             row += 1;
         }
     }
@@ -56,21 +59,11 @@ impl GamesData {
     pub fn add_game(&mut self, game_data: GameData) {
         self.game_data.push(game_data);
     }
-    pub fn get_game(&self, index: usize) -> GameData {
-        self.game_data[index].clone()
+    pub fn get_game(&self, index: usize) -> &GameData {
+        &self.game_data[index]
     }
     pub fn print_game(&self, index: usize) {
-        let game = self.get_game(index);
-        println!("Winner: {}", game.winner);
-        println!("Player 1: {}", game.player1);
-        println!("Player 2: {}", game.player2);
-        println!("---------------------------------");
-        for state in game.state_of_cells_list.iter(){
-            for cell in state.iter(){
-                print!("{} ", cell);
-            }
-            println!();
-        }
+        self.get_game(index).print_game();
     }
     // the glory code please don't touch it
     pub fn read_data(&mut self) {
@@ -92,7 +85,7 @@ impl GamesData {
                                     }
                                     "" => {
                                         if index >= 8 {
-                                            temp_game_data.state_of_cells_list.push(temp_game_data.periodic_state_of_cells.clone());
+                                            temp_game_data.state_of_cells_list.push(temp_game_data.periodic_state_of_cells);
                                         }
                                         index = 0;
                                     }
@@ -100,9 +93,11 @@ impl GamesData {
                                         temp_game_data.winner.push_str(item);
                                         temp_game_data.state_of_cells_list.push(temp_game_data.periodic_state_of_cells);
                                         index = 0;
-                                        self.game_data.push(temp_game_data.clone());
-                                        //if true the game ends
-                                        temp_game_data = GameData::new("ai".to_string(),"ai_2".to_string());
+                                        //if true the game ends, hand the finished game over without copying it
+                                        self.game_data.push(std::mem::replace(
+                                            &mut temp_game_data,
+                                            GameData::new("ai".to_string(),"ai_2".to_string()),
+                                        ));
                                     }
                                     _ => {
                                         println!("item: {}", item);
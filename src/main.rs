@@ -1,5 +1,6 @@
 
 use him_network::HimNetwork;
+use rand::Rng;
 
 
 mod input;
@@ -12,9 +13,10 @@ fn test_game(){
     let player_type = String::from("ai_Vs_ai");
     let mut cycles_count = 0;
     let cycles_limit = 200;//output::get_int("Enter the number of cycles to play: ");
+    let mut tictac_game = output::Game::new(player_type);
     loop {
-        let mut tictac_game = output::Game::new(player_type.clone());
         tictac_game.play();
+        tictac_game.reset();
         cycles_count += 1;
         if cycles_count >= cycles_limit {
             break;
@@ -25,17 +27,13 @@ fn test_reading () {
     //test_game();
     let mut game_data = input::GamesData::new(String::from("table.csv"));
     game_data.read_data();
-    let network = him_network::HimNetwork::new();
     let game_one = game_data.get_game(0);
     //game_one.print_game();
-    let data = game_one.state_of_cells_list;
+    let data = &game_one.state_of_cells_list;
     println!("Data: {:?}", data);
 
 } 
 
-
-use rand::Rng;
-
 fn main() {
     let mut him_net = HimNetwork::new(); // Initialize the network with 5 layers
     him_net.init_params(); // Initialize weights and biases
@@ -1,36 +1,35 @@
 use rand::Rng;
+use std::fmt::Write as FmtWrite;
 use std::io::Write;
 
 pub struct Cell {
-    pub owner: String,
     pub symbol: char,
     pub is_occupied: bool,
     pub index: i32,
-    pub position: i32,
     pub winning_cell: bool,
     pub owner_id: i32,
 }
 
 impl Cell {
     fn new(
-        owner: String,
         symbol: char,
         is_occupied: bool,
         index: i32,
-        position: i32,
         winning_cell: bool,
         owner_id: i32,
     ) -> Cell {
         Cell {
-            owner,
             symbol,
             is_occupied,
             index,
-            position,
             winning_cell,
             owner_id,
         }
     }
+    //keypad position (7 8 9 / 4 5 6 / 1 2 3) of the cell, derived from its index
+    pub fn position(&self) -> i32 {
+        7 - 3 * (self.index / 3) + self.index % 3
+    }
 }
 pub fn position_to_index(position: i32) -> i32 {
     if position > 6 {
@@ -41,19 +40,39 @@ pub fn position_to_index(position: i32) -> i32 {
         return position + 5;
     }
 }
+const WINNING_COMBOS: [[usize; 3]; 8] = [
+    [0, 1, 2],
+    [3, 4, 5],
+    [6, 7, 8],
+    [0, 3, 6],
+    [1, 4, 7],
+    [2, 5, 8],
+    [0, 4, 8],
+    [2, 4, 6],
+];
+//the same lines as bitboards, bit n set for cell index n
+const WINNING_MASKS: [u16; 8] = {
+    let mut masks = [0; 8];
+    let mut i = 0;
+    while i < 8 {
+        let combo = WINNING_COMBOS[i];
+        masks[i] = 1 << combo[0] | 1 << combo[1] | 1 << combo[2];
+        i += 1;
+    }
+    masks
+};
 pub struct Table {
     cells: Vec<Cell>,
     full: bool,
     //winning_combo: Vec<Cell>,
     play_count: i32,
-    winning_combo: [[usize; 3]; 8],
     winner: String,
+    render: bool,
+    csv_rows: String, //rows of the game in progress, not yet written to table.csv
 }
 
 /// Creates a new `Table` instance with default values.
 
-/// Returns the list of winning combinations that include the given cell index.
-
 /// Checks if the given player has won after making a move at the specified index.
 
 /// Initializes the `Table` for a new game.
@@ -68,43 +87,22 @@ pub struct Table {
 impl Table {
     pub fn new() -> Table {
         let cells_in = (0..9)
-            .map(|i| Cell::new(String::new(), ' ', false, i, i, false, 0))
+            .map(|i| Cell::new(' ', false, i, false, 0))
             .collect();
         Table {
             cells: cells_in,
             full: false,
-            winning_combo: [
-                [0, 1, 2],
-                [3, 4, 5],
-                [6, 7, 8],
-                [0, 3, 6],
-                [1, 4, 7],
-                [2, 5, 8],
-                [0, 4, 8],
-                [2, 4, 6],
-            ],
             play_count: 0,
             winner: String::new(),
+            render: true,
+            csv_rows: String::new(),
         }
     }
-    fn get_relevant_list(&self, index: i32) -> Vec<[usize; 3]> {
-        let mut relevant_list = Vec::new();
-        for combo in self.winning_combo.iter() {
-            if combo.contains(&(index as usize)) {
-                relevant_list.push(*combo);
-            }
-        }
-        relevant_list
-    }
     fn check_winner(&mut self, player: &Player, index: i32) -> bool {
-        for combo in self.get_relevant_list(index) {
-            let mut count = 0;
-            for cell in combo.iter() {
-                if self.cells[*cell].owner == player.name {
-                    count += 1;
-                }
-            }
-            if count == 3 {
+        //only lines through the cell just played can have been completed
+        let cell_bit = 1 << index;
+        for (combo, mask) in WINNING_COMBOS.iter().zip(WINNING_MASKS.iter()) {
+            if mask & cell_bit != 0 && player.bitboard & mask == *mask {
                 for cell in combo.iter() {
                     self.cells[*cell].winning_cell = true;
                 }
@@ -115,70 +113,66 @@ impl Table {
     }
     pub fn init(&mut self) {
         let mut count = 0;
-        let mut position = 7;
-        let mut row_count = 0;
         for cell in self.cells.iter_mut() {
-            cell.owner = String::new();
-            cell.symbol = count.to_string().chars().next().unwrap();
+            cell.owner_id = 0;
+            cell.symbol = char::from_digit(count as u32, 10).unwrap();
             cell.is_occupied = false;
             cell.winning_cell = false;
-            cell.position = position;
             cell.index = count;
-            position += 1;
             count += 1;
-            row_count += 1;
-            if row_count == 3 {
-                row_count = 0;
-                position -= 6;
-            }
         }
+        self.full = false;
+        self.play_count = 0;
+        self.winner.clear();
+        self.csv_rows.clear();
     }
     pub fn get_cell(&self, index: i32) -> &Cell {
         &self.cells[index as usize]
     }
 
     pub fn print(&self) {
+        if !self.render {
+            return;
+        }
         if cfg!(target_os = "windows") {
             std::process::Command::new("cmd")
                 .args(&["/C", "cls"])
                 .status()
                 .unwrap();
         } else {
-            std::process::Command::new("clear").status().unwrap();
+            //ANSI clear screen + cursor home, instead of spawning `clear` on every redraw
+            print!("\x1B[2J\x1B[1;1H");
         }
-        println!(
-            "{} | {} | {}",
-            self.symbol_or_position(0),
-            self.symbol_or_position(1),
-            self.symbol_or_position(2)
-        );
-        println!("---------");
-        println!(
-            "{} | {} | {}",
-            self.symbol_or_position(3),
-            self.symbol_or_position(4),
-            self.symbol_or_position(5)
-        );
-        println!("---------");
-        println!(
-            "{} | {} | {}",
-            self.symbol_or_position(6),
-            self.symbol_or_position(7),
-            self.symbol_or_position(8)
-        );
+        //build the whole board first so it reaches the terminal in one write
+        let mut board = String::with_capacity(3 * 10 + 2 * 10); //three rows, two separators, 10 bytes each
+        for row in 0..3 {
+            if row > 0 {
+                board.push_str("---------\n");
+            }
+            let start = row * 3;
+            writeln!(
+                board,
+                "{} | {} | {}",
+                self.symbol_or_position(start),
+                self.symbol_or_position(start + 1),
+                self.symbol_or_position(start + 2)
+            )
+            .unwrap();
+        }
+        print!("{}", board);
     }
-    fn symbol_or_position(&self, index: i32) -> String {
+    fn symbol_or_position(&self, index: i32) -> char {
         if self.cells[index as usize].is_occupied {
-            return self.cells[index as usize].symbol.to_string();
+            return self.cells[index as usize].symbol;
         }
-        return self.cells[index as usize].position.to_string();
+        return char::from_digit(self.cells[index as usize].position() as u32, 10).unwrap();
     }
     pub fn play(&mut self, player: &mut Player, index: i32) {
         if self.cells[index as usize].is_occupied {
             println!("Cell is already occupied");
             return;
         }
-        if self.check_full() {
+        if self.full {
             return;
         };
 
@@ -187,42 +181,49 @@ impl Table {
         self.save_table_csv();// save the table state to a csv file
     }
     fn place_cell(&mut self, player: &mut Player, index: i32) {
-        self.cells[index as usize].owner = player.name.clone();
         self.cells[index as usize].symbol = player.symbol.clone();
         self.cells[index as usize].is_occupied = true;
         self.cells[index as usize].owner_id = if player.name == "ai" { 1 } else { -1 };
+        player.bitboard |= 1 << index;
         self.print();
         self.play_count += 1;
         if self.check_winner(player, index) {
-            println!("{} wins!", player.name.clone());
-            self.winner = player.name.clone();
+            println!("{} wins!", player.name);
+            self.winner.clone_from(&player.name);
         };
 
     }
     pub fn check_full(&mut self) -> bool {
         if self.play_count > 8 {
             self.full = true;
-            self.winner = "draw".to_string();
+            self.winner.clear();
+            self.winner.push_str("draw");
         }
         self.full
     }
-    pub fn save_table_csv(&self) {
-        let mut csv = String::new();
-        csv.push_str("\n");
+    //play() keeps full and winner up to date after every move, so just read them
+    pub fn is_over(&self) -> bool {
+        self.full || !self.winner.is_empty()
+    }
+    pub fn save_table_csv(&mut self) {
+        self.csv_rows.push('\n');
         for cell in self.cells.iter() {
-            csv.push_str(&cell.owner_id.to_string());
-            csv.push_str(",");
+            write!(self.csv_rows, "{},", cell.owner_id).unwrap();
+        }
+        self.csv_rows.push_str(&self.winner);
+        //keep buffering until the game has a result, then append all its rows in one write
+        if self.winner.is_empty() {
+            return;
         }
-        csv.push_str(&self.winner);
 
         std::fs::OpenOptions::new()
             .create(true)
             .append(true)
             .open("table.csv")
             .unwrap()
-            .write_all(csv.as_bytes())
+            .write_all(self.csv_rows.as_bytes())
             .unwrap();
-
+        self.csv_rows.clear();
     }
 }
 
@@ -230,7 +231,7 @@ pub struct Player {
     pub name: String,
     pub symbol: char,
     pub is_ai: bool,
-    pub previous_moves: Vec<i32>,
+    pub bitboard: u16, //cells owned by this player, bit n set for cell index n
 }
 
 impl Player {
@@ -240,12 +241,11 @@ impl Player {
             name,
             symbol,
             is_ai,
-            previous_moves: Vec::new(),
+            bitboard: 0,
         }
     }
     pub fn play(&mut self, table: &mut Table, index: i32) {
         table.play(self, position_to_index(index));
-        self.previous_moves.push(index);
     }
 }
 
@@ -290,8 +290,6 @@ pub struct Game {
     pub tictac_board: Table,
     pub player1: Player,
     pub player2: Player,
-    pub player1_moves: Vec<i32>,
-    pub player2_moves: Vec<i32>,
     pub game_over: bool,
 }
 
@@ -300,15 +298,22 @@ impl Game {
         let mut tictac_board = Table::new();
         tictac_board.init();
         let (player1, player2) = Game::init_player(player_type);
+        //nobody is watching an ai vs ai game, skip redrawing the board on every move
+        tictac_board.render = !(player1.is_ai && player2.is_ai);
         Game {
             tictac_board,
             player1,
             player2,
-            player1_moves: Vec::new(),
-            player2_moves: Vec::new(),
             game_over: false,
         }
     }
+    //clear the board and both players' cells so the same game can be played again
+    pub fn reset(&mut self) {
+        self.tictac_board.init();
+        self.player1.bitboard = 0;
+        self.player2.bitboard = 0;
+        self.game_over = false;
+    }
     //initialize the players based oin the game type the user insrtucts
     pub fn init_player(player_type:String)->(Player,Player){
         if player_type == "ai_Vs_ai" {
@@ -335,13 +340,14 @@ impl Game {
             (player1, player2)
         }
     }
+    //pick straight from the free positions instead of re-rolling until one is free
     pub fn ai_play_move(&mut self) -> i32 {
+        let taken = self.player1.bitboard | self.player2.bitboard;
+        let free_moves: Vec<i32> = (1..10)
+            .filter(|m| taken & (1 << position_to_index(*m)) == 0)
+            .collect();
         let mut rng = rand::thread_rng();
-        let mut ai_move = rng.gen_range(1..10);
-        while self.player1_moves.contains(&ai_move) || self.player2_moves.contains(&ai_move) {
-            ai_move = rng.gen_range(1..10);
-        }
-        ai_move
+        free_moves[rng.gen_range(0..free_moves.len())]
     }
     pub fn play(&mut self) {
         let mut iterator = 0;
@@ -350,10 +356,8 @@ impl Game {
             let input = self.get_input();
             if iterator == 0 {
                 self.player1.play(&mut self.tictac_board, input);
-                self.player1_moves.push(input);
             } else {
                 self.player2.play(&mut self.tictac_board, input);
-                self.player2_moves.push(input);
             }
 
             if self.check_game_over() {
@@ -364,7 +368,7 @@ impl Game {
         }
     }
     fn check_game_over(&mut self)-> bool {
-        if self.tictac_board.check_full() || self.tictac_board.winner != "" {
+        if self.tictac_board.is_over() {
             self.game_over = true;
         }
         self.game_over
@@ -380,3 +384,39 @@ impl Game {
         input
     }
 }
+
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_check_winner_bitboard() {
+        let mut table = Table::new();
+        table.init();
+        table.render = false;
+        let mut player = Player::new("ai".to_string(), 'X');
+        // Two cells of the 0-4-8 diagonal are not a win yet
+        table.place_cell(&mut player, 0);
+        table.place_cell(&mut player, 4);
+        assert_eq!(table.winner, "");
+        // The third cell completes the line and marks it
+        table.place_cell(&mut player, 8);
+        assert_eq!(table.winner, "ai");
+        assert!(table.get_cell(0).winning_cell);
+        assert!(table.get_cell(8).winning_cell);
+        assert!(!table.get_cell(2).winning_cell);
+    }
+
+    #[test]
+    fn test_cell_position_keypad_layout() {
+        let table = Table::new();
+        // Indices run left to right, top to bottom; positions follow the keypad
+        let expected = [7, 8, 9, 4, 5, 6, 1, 2, 3];
+        for index in 0..9 {
+            let position = table.get_cell(index).position();
+            assert_eq!(position, expected[index as usize]);
+            assert_eq!(position_to_index(position), index);
+        }
+    }
+}